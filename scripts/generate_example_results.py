@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
-import json
+import sys
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
@@ -14,47 +14,53 @@ import numpy as np
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 RESULTS_DIR = REPO_ROOT / "results"
+# Allow running without installing the package
+sys.path.insert(0, str(REPO_ROOT / "src"))
+
+from leap_pqc_sim.results import write_json  # noqa: E402
 
 
 def now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
-def summarize_ms(xs: List[float]) -> Dict[str, float]:
-    a = np.array(xs, dtype=float)
+def summarize_ms(xs: np.ndarray) -> Dict[str, float]:
+    a = np.asarray(xs, dtype=np.float64)
+    # one call -> one sort for all quantiles
+    p50, p90, p95, p99 = np.percentile(a, [50, 90, 95, 99])
     return {
         "count": int(a.size),
         "mean_ms": float(a.mean()),
-        "p50_ms": float(np.percentile(a, 50)),
-        "p90_ms": float(np.percentile(a, 90)),
-        "p95_ms": float(np.percentile(a, 95)),
-        "p99_ms": float(np.percentile(a, 99)),
+        "p50_ms": float(p50),
+        "p90_ms": float(p90),
+        "p95_ms": float(p95),
+        "p99_ms": float(p99),
         "max_ms": float(a.max()),
     }
 
 
 def summarize_bytes(xs: List[int]) -> Dict[str, float]:
-    a = np.array(xs, dtype=float)
+    a = np.asarray(xs, dtype=np.float64)
+    p50, p95 = np.percentile(a, [50, 95])
     return {
         "count": int(a.size),
         "mean_bytes": float(a.mean()),
-        "p50_bytes": float(np.percentile(a, 50)),
-        "p95_bytes": float(np.percentile(a, 95)),
+        "p50_bytes": float(p50),
+        "p95_bytes": float(p95),
         "max_bytes": float(a.max()),
     }
 
 
-def make_dist(mean: float, std: float, n: int, seed: int) -> List[float]:
-    rng = np.random.default_rng(seed)
+def make_dist(rng: np.random.Generator, mean: float, std: float, n: int) -> np.ndarray:
     xs = rng.normal(loc=mean, scale=std, size=n)
-    xs = np.clip(xs, a_min=0.1, a_max=None)
-    return xs.tolist()
+    np.clip(xs, 0.1, None, out=xs)
+    return xs
 
 
-def make_result(mode: str, n: int, verify_ms: List[float], sign_ms: List[float], size_b: List[int]) -> Dict[str, object]:
-    wall_time_s = float(sum(verify_ms) / 1000.0)  # toy
+def make_result(mode: str, n: int, verify_ms: np.ndarray, sign_ms: np.ndarray, size_b: List[int]) -> Dict[str, object]:
+    wall_time_s = float(verify_ms.sum() / 1000.0)  # toy
     throughput = float(n / wall_time_s) if wall_time_s > 0 else float("inf")
-    total_ms = [v + s + 2.0 for v, s in zip(verify_ms, sign_ms)]  # add tiny network
+    total_ms = verify_ms + sign_ms + 2.0  # add tiny network
     return {
         "meta": {
             "timestamp": now_iso(),
@@ -92,13 +98,18 @@ def main() -> None:
     # Roughly aligned to the Phase-2 report headline numbers:
     # - traditional verification ~28 ms
     # - PQC verification ~210 ms
-    verify_rsa = make_dist(mean=28.1, std=6.0, n=n, seed=1)
-    verify_pqc = make_dist(mean=209.9, std=35.0, n=n, seed=2)
-    verify_hyb = [(a + b) for a, b in zip(verify_rsa, verify_pqc)]
+    # Independent streams for the four distributions, all derived from one seed.
+    rng_verify_rsa, rng_verify_pqc, rng_sign_rsa, rng_sign_pqc = (
+        np.random.default_rng(s) for s in np.random.SeedSequence(entropy=0).spawn(4)
+    )
+
+    verify_rsa = make_dist(rng_verify_rsa, mean=28.1, std=6.0, n=n)
+    verify_pqc = make_dist(rng_verify_pqc, mean=209.9, std=35.0, n=n)
+    verify_hyb = verify_rsa + verify_pqc
 
-    sign_rsa = make_dist(mean=6.0, std=2.0, n=n, seed=3)
-    sign_pqc = make_dist(mean=45.0, std=10.0, n=n, seed=4)
-    sign_hyb = [(a + b) for a, b in zip(sign_rsa, sign_pqc)]
+    sign_rsa = make_dist(rng_sign_rsa, mean=6.0, std=2.0, n=n)
+    sign_pqc = make_dist(rng_sign_pqc, mean=45.0, std=10.0, n=n)
+    sign_hyb = sign_rsa + sign_pqc
 
     # Base message size (without signatures), then add signature overhead.
     base = 850
@@ -108,9 +119,9 @@ def main() -> None:
     size_pqc = [base + sig_pqc for _ in range(n)]
     size_hyb = [base + sig_rsa + sig_pqc for _ in range(n)]
 
-    (RESULTS_DIR / "example_rsa.json").write_text(json.dumps(make_result("rsa", n, verify_rsa, sign_rsa, size_rsa), indent=2), encoding="utf-8")
-    (RESULTS_DIR / "example_pqc.json").write_text(json.dumps(make_result("pqc", n, verify_pqc, sign_pqc, size_pqc), indent=2), encoding="utf-8")
-    (RESULTS_DIR / "example_hybrid.json").write_text(json.dumps(make_result("hybrid", n, verify_hyb, sign_hyb, size_hyb), indent=2), encoding="utf-8")
+    write_json(RESULTS_DIR / "example_rsa.json", make_result("rsa", n, verify_rsa, sign_rsa, size_rsa))
+    write_json(RESULTS_DIR / "example_pqc.json", make_result("pqc", n, verify_pqc, sign_pqc, size_pqc))
+    write_json(RESULTS_DIR / "example_hybrid.json", make_result("hybrid", n, verify_hyb, sign_hyb, size_hyb))
 
     print("Wrote example results to results/example_*.json")
 
@@ -7,8 +7,12 @@ import sys
 from pathlib import Path
 from typing import Dict, List, Tuple
 
-import matplotlib.pyplot as plt
-import numpy as np
+import matplotlib
+
+matplotlib.use("Agg")  # file output only; no GUI backend / figure manager
+
+import matplotlib.pyplot as plt  # noqa: E402
+import numpy as np  # noqa: E402
 
 
 def parse_args() -> argparse.Namespace:
@@ -38,55 +42,66 @@ def _load(path: Path) -> Dict[str, object]:
     return json.loads(path.read_text(encoding="utf-8"))
 
 
-def plot_verification_cdf(results: List[Dict[str, object]], outdir: Path) -> None:
-    plt.figure()
+def plot_verification_cdf(results: List[Dict[str, object]], outdir: Path, fig: plt.Figure, ax: plt.Axes) -> None:
+    # Runs written with --no-raw have no per-message values to plot.
+    results = [r for r in results if "raw" in r]
+    if not results:
+        print("Skipping verification_cdf.png: no input has raw values.")
+        return
+
+    # Runs usually share the same n, so the CDF y-axis can be built once.
+    lengths = {len(r["raw"]["verify_times_ms"]) for r in results}
+    ys_common = None
+    if len(lengths) == 1:
+        n = lengths.pop()
+        ys_common = np.linspace(1.0 / n, 1.0, n)
+
+    ax.cla()
     for r in results:
         meta = r["meta"]
-        xs = np.array(r["raw"]["verify_times_ms"], dtype=float)
-        xs = np.sort(xs)
-        ys = np.arange(1, len(xs) + 1) / len(xs)
-        plt.plot(xs, ys, label=_label(meta))
-
-    plt.xlabel("Gateway signature verification time (ms)")
-    plt.ylabel("CDF")
-    plt.title("Verification time distribution (CDF)")
-    plt.grid(True, alpha=0.3)
-    plt.legend()
+        # float32 is plenty for plotting; sort in place instead of np.sort's copy
+        xs = np.array(r["raw"]["verify_times_ms"], dtype=np.float32)
+        xs.sort()
+        ys = ys_common if ys_common is not None else np.arange(1, len(xs) + 1) / len(xs)
+        ax.plot(xs, ys, label=_label(meta))
+
+    ax.set_xlabel("Gateway signature verification time (ms)")
+    ax.set_ylabel("CDF")
+    ax.set_title("Verification time distribution (CDF)")
+    ax.grid(True, alpha=0.3)
+    ax.legend()
     out_path = outdir / "verification_cdf.png"
-    plt.savefig(out_path, dpi=180, bbox_inches="tight")
-    plt.close()
+    fig.savefig(out_path, dpi=180, bbox_inches="tight")
 
 
-def plot_message_size_bar(results: List[Dict[str, object]], outdir: Path) -> None:
+def plot_message_size_bar(results: List[Dict[str, object]], outdir: Path, fig: plt.Figure, ax: plt.Axes) -> None:
     labels = [_label(r["meta"]) for r in results]
     means = [r["summary"]["message_size"]["mean_bytes"] for r in results]
 
-    plt.figure()
+    ax.cla()
     x = np.arange(len(labels))
-    plt.bar(x, means)
-    plt.xticks(x, labels, rotation=20, ha="right")
-    plt.ylabel("Mean serialized message size (bytes)")
-    plt.title("Message size impact")
-    plt.grid(True, axis="y", alpha=0.3)
+    ax.bar(x, means)
+    ax.set_xticks(x, labels, rotation=20, ha="right")
+    ax.set_ylabel("Mean serialized message size (bytes)")
+    ax.set_title("Message size impact")
+    ax.grid(True, axis="y", alpha=0.3)
     out_path = outdir / "message_size_bar.png"
-    plt.savefig(out_path, dpi=180, bbox_inches="tight")
-    plt.close()
+    fig.savefig(out_path, dpi=180, bbox_inches="tight")
 
 
-def plot_throughput_bar(results: List[Dict[str, object]], outdir: Path) -> None:
+def plot_throughput_bar(results: List[Dict[str, object]], outdir: Path, fig: plt.Figure, ax: plt.Axes) -> None:
     labels = [_label(r["meta"]) for r in results]
     thr = [r["summary"]["throughput_msg_per_s"] for r in results]
 
-    plt.figure()
+    ax.cla()
     x = np.arange(len(labels))
-    plt.bar(x, thr)
-    plt.xticks(x, labels, rotation=20, ha="right")
-    plt.ylabel("Throughput (messages / second)")
-    plt.title("End-to-end throughput")
-    plt.grid(True, axis="y", alpha=0.3)
+    ax.bar(x, thr)
+    ax.set_xticks(x, labels, rotation=20, ha="right")
+    ax.set_ylabel("Throughput (messages / second)")
+    ax.set_title("End-to-end throughput")
+    ax.grid(True, axis="y", alpha=0.3)
     out_path = outdir / "throughput_bar.png"
-    plt.savefig(out_path, dpi=180, bbox_inches="tight")
-    plt.close()
+    fig.savefig(out_path, dpi=180, bbox_inches="tight")
 
 
 def main() -> None:
@@ -96,9 +111,14 @@ def main() -> None:
 
     results = [_load(Path(p)) for p in args.inputs]
 
-    plot_verification_cdf(results, outdir)
-    plot_message_size_bar(results, outdir)
-    plot_throughput_bar(results, outdir)
+    # One figure for all plots; each plot function clears the axes first.
+    fig, ax = plt.subplots()
+    try:
+        plot_verification_cdf(results, outdir, fig, ax)
+        plot_message_size_bar(results, outdir, fig, ax)
+        plot_throughput_bar(results, outdir, fig, ax)
+    finally:
+        plt.close(fig)
 
     print(f"Wrote plots to: {outdir}")
 
@@ -2,7 +2,6 @@
 from __future__ import annotations
 
 import argparse
-import json
 import sys
 from pathlib import Path
 
@@ -10,6 +9,7 @@ from pathlib import Path
 REPO_ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(REPO_ROOT / "src"))
 
+from leap_pqc_sim.results import write_json  # noqa: E402
 from leap_pqc_sim.sim import SimulationConfig, run_benchmark  # noqa: E402
 
 
@@ -22,7 +22,24 @@ def parse_args() -> argparse.Namespace:
     p.add_argument("--oqs-alg", type=str, default="Dilithium3")
     p.add_argument("--mock-level", type=int, choices=[2, 3, 5], default=3)
     p.add_argument("--fault", choices=["invalid_sig", "unknown_kid"], default=None)
-    p.add_argument("--network-delay-ms", type=float, default=0.5)
+    p.add_argument(
+        "--network-delay-ms", type=float, default=0.0, help="Sleep per hop (2 hops per message); 0 = no sleep."
+    )
+    p.add_argument("--executor", choices=["thread", "process"], default="thread")
+    p.add_argument(
+        "--verify-cache-size",
+        type=int,
+        default=None,
+        help="Gateway verify-result cache entries (0 = off; default: on only with --batch-size > 1).",
+    )
+    p.add_argument("--batch-size", type=int, default=1, help="Sign one Merkle root per this many BAHs.")
+    p.add_argument(
+        "--signing-bytes",
+        choices=["json", "packed"],
+        default="packed",
+        help="Sign a compact packed BAH encoding or the BAH canonical JSON.",
+    )
+    p.add_argument("--no-raw", action="store_true", help="Omit per-message raw values (summary only).")
     p.add_argument("--out", type=str, default="results/out.json")
     return p.parse_args()
 
@@ -39,18 +56,26 @@ def main() -> None:
         mock_level=args.mock_level,
         fault=args.fault,
         network_delay_ms=args.network_delay_ms,
+        batch_size=args.batch_size,
+        executor=args.executor,
+        verify_cache_size=args.verify_cache_size,
+        signing_bytes_mode=args.signing_bytes,
+        include_raw=not args.no_raw,
     )
 
     result = run_benchmark(cfg)
 
     out_path = Path(args.out)
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    out_path.write_text(json.dumps(result, indent=2, ensure_ascii=False), encoding="utf-8")
+    write_json(out_path, result)
 
     # concise console output
     s = result["summary"]
     print("=== Benchmark done ===")
-    print(f"mode={args.mode}  pqc_backend={args.pqc_backend}  n={args.n}  concurrency={args.concurrency}")
+    print(
+        f"mode={args.mode}  pqc_backend={args.pqc_backend}  n={args.n}  concurrency={args.concurrency}"
+        f"  batch_size={args.batch_size}  executor={args.executor}"
+    )
     print(f"accepted={s['accepted']}  rejected={s['rejected']}")
     print(f"throughput={s['throughput_msg_per_s']:.2f} msg/s  wall={s['wall_time_s']:.2f}s")
     print(f"verify_mean={s['verification']['mean_ms']:.2f}ms  p95={s['verification']['p95_ms']:.2f}ms")
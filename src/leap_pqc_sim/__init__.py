@@ -5,5 +5,5 @@ Educational simulator for post-quantum signature migration in payment-like messa
 This is a toy project inspired by BIS Innovation Hub Project Leap Phase 2 (2025).
 """
 
-__all__ = ["models", "canonical", "crypto", "sim"]
+__all__ = ["models", "canonical", "crypto", "results", "sim"]
 __version__ = "0.1.0"
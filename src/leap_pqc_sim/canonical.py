@@ -1,7 +1,47 @@
 from __future__ import annotations
 
 import json
-from typing import Any, Mapping
+from functools import lru_cache
+from typing import Any, Callable, Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
+
+
+@lru_cache(maxsize=None)
+def _model_dump_for(cls: type) -> Optional[Callable[..., Any]]:
+    # Resolved once per class instead of probing every object.
+    return getattr(cls, "model_dump", None)
+
+
+# orjson and stdlib json print a float identically only for 0 and 1e-4 <= |x| < 1e16;
+# outside that the exponent form differs (1e16 vs 1e+16, 0.00001 vs 1e-05), and NaN/inf
+# become null instead of NaN/Infinity. orjson also rejects ints beyond 64 bits.
+_ORJSON_FLOAT_MIN = 1e-4
+_ORJSON_FLOAT_MAX = 1e16
+_ORJSON_INT_MIN = -(2**63)
+_ORJSON_INT_MAX = 2**64 - 1
+
+
+def _orjson_matches_stdlib(obj: Any) -> bool:
+    if isinstance(obj, str):
+        return True
+    if isinstance(obj, float):
+        # NaN fails both comparisons, inf fails the upper bound
+        return obj == 0.0 or _ORJSON_FLOAT_MIN <= abs(obj) < _ORJSON_FLOAT_MAX
+    if isinstance(obj, int):
+        return _ORJSON_INT_MIN <= obj <= _ORJSON_INT_MAX
+    if isinstance(obj, dict):
+        for k, v in obj.items():
+            if not (_orjson_matches_stdlib(k) and _orjson_matches_stdlib(v)):
+                return False
+    elif isinstance(obj, (list, tuple)):
+        for v in obj:
+            if not _orjson_matches_stdlib(v):
+                return False
+    return True
 
 
 def canonical_json_bytes(obj: Any) -> bytes:
@@ -11,16 +51,19 @@ def canonical_json_bytes(obj: Any) -> bytes:
     - sort_keys=True
     - separators=(',', ':')  (no whitespace)
     - ensure_ascii=False
+
+    If `orjson` is installed it is used instead of the stdlib `json` module, unless the
+    payload holds a number the two would print differently (see `_orjson_matches_stdlib`),
+    so the bytes never depend on whether the optional extra is installed.
     """
 
     # Pydantic models support `model_dump()`.
-    if hasattr(obj, "model_dump"):
-        obj = obj.model_dump(mode="json")  # type: ignore[attr-defined]
+    dump = _model_dump_for(type(obj))
+    if dump is not None:
+        obj = dump(obj, mode="json")
 
-    if isinstance(obj, Mapping):
-        payload = obj
-    else:
-        payload = obj  # json.dumps can handle dict/list/str/int/float etc.
+    if orjson is not None and _orjson_matches_stdlib(obj):
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
 
-    s = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    s = json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
     return s.encode("utf-8")
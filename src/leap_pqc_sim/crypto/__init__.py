@@ -1,7 +1,8 @@
 from .base import KeyStore, PublicKeyRecord, Signer, b64d, b64e, KeyNotFoundError, AlgorithmMismatchError
 from .rsa_pss import RSAPSSSigner
 from .mock_pqc import MockDilithiumSigner
-from .oqs_dilithium import OQSDilithiumSigner, oqs_verify
+from .oqs_dilithium import OQSDilithiumSigner, oqs_verify, check_oqs_alg
+from .merkle import merkle_leaf, merkle_root_and_proofs, merkle_root_from_proof
 
 __all__ = [
     "KeyStore",
@@ -15,4 +16,8 @@ __all__ = [
     "MockDilithiumSigner",
     "OQSDilithiumSigner",
     "oqs_verify",
+    "check_oqs_alg",
+    "merkle_leaf",
+    "merkle_root_and_proofs",
+    "merkle_root_from_proof",
 ]
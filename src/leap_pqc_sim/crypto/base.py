@@ -1,17 +1,19 @@
 from __future__ import annotations
 
-import base64
+import binascii
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Dict, Tuple
+from typing import Dict, Iterator, Tuple
 
 
+# binascii directly: same output as base64.b64encode/b64decode without the wrapper
+# call and (for decoding) the str -> bytes copy.
 def b64e(data: bytes) -> str:
-    return base64.b64encode(data).decode("ascii")
+    return binascii.b2a_base64(data, newline=False).decode("ascii")
 
 
 def b64d(data_b64: str) -> bytes:
-    return base64.b64decode(data_b64.encode("ascii"))
+    return binascii.a2b_base64(data_b64)
 
 
 class KeyNotFoundError(KeyError):
@@ -42,9 +44,13 @@ class KeyStore:
         self._store[kid] = PublicKeyRecord(alg=alg, public_key=public_key)
 
     def get(self, kid: str) -> PublicKeyRecord:
-        if kid not in self._store:
-            raise KeyNotFoundError(kid)
-        return self._store[kid]
+        try:
+            return self._store[kid]
+        except KeyError:
+            raise KeyNotFoundError(kid) from None
+
+    def items(self) -> Iterator[Tuple[str, PublicKeyRecord]]:
+        return iter(self._store.items())
 
 
 class Signer(ABC):
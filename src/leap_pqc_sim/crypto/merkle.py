@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import hashlib
+from typing import List, Optional, Sequence, Tuple
+
+
+# Leaf and interior hashes use different prefixes (RFC 6962 style) so a leaf can never
+# be passed off as an interior node.
+_LEAF_PREFIX = b"\x00"
+_NODE_PREFIX = b"\x01"
+
+
+def merkle_leaf(data: bytes) -> bytes:
+    return hashlib.sha256(_LEAF_PREFIX + data).digest()
+
+
+def _node(left: bytes, right: bytes) -> bytes:
+    return hashlib.sha256(_NODE_PREFIX + left + right).digest()
+
+
+def merkle_root_and_proofs(leaves: Sequence[bytes]) -> Tuple[bytes, List[List[bytes]]]:
+    """Build a binary Merkle tree over leaf hashes (RFC 6962 shape).
+
+    Returns the root and, for each leaf, its inclusion proof: the sibling hashes from the
+    bottom level up. An odd node at the end of a level is promoted unchanged (it has no
+    sibling at that level). Pairing it with itself instead would let `[a, b, c]` and
+    `[a, b, c, c]` share a root (CVE-2012-2459).
+    """
+    if not leaves:
+        raise ValueError("Merkle tree needs at least one leaf")
+
+    proofs: List[List[bytes]] = [[] for _ in leaves]
+    positions = list(range(len(leaves)))  # position of each leaf's ancestor on the current level
+    level = list(leaves)
+    while len(level) > 1:
+        for i, pos in enumerate(positions):
+            sibling = pos ^ 1
+            if sibling < len(level):
+                proofs[i].append(level[sibling])
+            positions[i] = pos >> 1
+        parents = [_node(level[k], level[k + 1]) for k in range(0, len(level) - 1, 2)]
+        if len(level) % 2:
+            parents.append(level[-1])
+        level = parents
+    return level[0], proofs
+
+
+def merkle_root_from_proof(leaf: bytes, index: int, size: int, proof: Sequence[bytes]) -> Optional[bytes]:
+    """Recompute the root from a leaf hash, its position, the tree size and its proof.
+
+    Follows the RFC 9162 (2.1.3.2) inclusion-proof algorithm; the tree size tells which
+    levels promoted this leaf's ancestor without a sibling. Returns None if the proof
+    does not fit a tree of `size` leaves.
+    """
+    if not 0 <= index < size:
+        return None
+    fn, sn = index, size - 1
+    h = leaf
+    for sibling in proof:
+        if sn == 0:
+            return None  # proof longer than the tree is tall
+        if fn & 1 or fn == sn:
+            h = _node(sibling, h)
+            # skip the levels where this ancestor was the promoted last node
+            while not fn & 1 and fn != 0:
+                fn >>= 1
+                sn >>= 1
+        else:
+            h = _node(h, sibling)
+        fn >>= 1
+        sn >>= 1
+    if sn != 0:
+        return None  # proof too short
+    return h
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import hashlib
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Literal
 
 from cryptography.hazmat.primitives import serialization
@@ -23,24 +24,55 @@ _DILITHIUM_SIZES = {
 }
 
 
+# verify() infers the level from the (padded) public key length.
+_LEVEL_BY_PK_LEN = {v["pk"]: level for level, v in _DILITHIUM_SIZES.items()}
+
+# Signature bulk after the 64-byte Ed25519 signature; verify() checks it byte for byte,
+# so tampering anywhere in the signature is rejected, as with a real scheme.
+_SIG_PAD = {level: bytes(max(0, v["sig"] - 64)) for level, v in _DILITHIUM_SIZES.items()}
+
+
+@lru_cache(maxsize=1024)
+def _load_ed25519_public_key(pk_raw: bytes) -> ed25519.Ed25519PublicKey:
+    return ed25519.Ed25519PublicKey.from_public_bytes(pk_raw)
+
+
 def _expand(seed: bytes, length: int) -> bytes:
-    """Deterministically expand `seed` into `length` bytes."""
-    out = bytearray()
-    counter = 0
-    while len(out) < length:
-        counter_bytes = counter.to_bytes(4, "big")
-        out.extend(hashlib.sha3_256(seed + counter_bytes).digest())
-        counter += 1
-    return bytes(out[:length])
-
-
-def _burn_cpu(tag: bytes, iters: int) -> None:
-    """Spend CPU time deterministically (no sleep)."""
-    x = tag
-    for _ in range(max(0, iters)):
-        x = hashlib.sha3_256(x).digest()
+    """Deterministically expand `seed` into `length` bytes (SHAKE256 XOF)."""
+    return hashlib.shake_256(seed).digest(length)
+
+
+# SHAKE256 rate: squeezing this many bytes costs one Keccak-f[1600] permutation.
+_SHAKE256_RATE = 136
+# Rate blocks per digest() call in _burn_cpu: 4.3 KiB stays in L1, and the Python loop
+# runs only iters / 32 times.
+_BURN_CHUNK_BLOCKS = 32
+
+
+def _burn_cpu(tag: bytes, msg: bytes, iters: int) -> None:
+    """Spend CPU time deterministically (no sleep).
+
+    `iters` SHAKE256 rate blocks are squeezed: the same `iters` Keccak permutations as
+    chaining `iters` SHA3-256 calls, but mostly inside C. Each digest() call squeezes
+    afresh from the absorbed state, so the blocks are squeezed in fixed-size chunks
+    instead of one `iters`-block buffer, which would add allocation and memory traffic
+    that a real verify does not have. The hash is seeded with `tag` and the first 32
+    bytes of `msg`, absorbed without copying.
+
+    hashlib has no multi-lane (4-way) Keccak to group messages into; work is amortized
+    across messages one level up instead, by signing a Merkle root per batch.
+    """
+    h = hashlib.shake_256(tag)
+    h.update(memoryview(msg)[:32])
+    full, rest = divmod(max(0, iters), _BURN_CHUNK_BLOCKS)
+    buf = b""
+    for _ in range(full):
+        buf = h.digest(_BURN_CHUNK_BLOCKS * _SHAKE256_RATE)
+    if rest:
+        buf = h.digest(rest * _SHAKE256_RATE)
+    x = memoryview(buf)[-32:]
     # prevent Python from optimizing away
-    if x[0] == 257:  # impossible
+    if len(x) and x[0] == 257:  # impossible
         raise RuntimeError("unreachable")
 
 
@@ -60,6 +92,8 @@ class MockDilithiumSigner(Signer):
     kid: str
     level: Literal[2, 3, 5] = 3
     _sk: ed25519.Ed25519PrivateKey | None = None
+    _padded_pk: bytes = b""
+    _sig_pad: bytes = b""
 
     @property
     def alg(self) -> str:  # type: ignore[override]
@@ -69,41 +103,59 @@ class MockDilithiumSigner(Signer):
     def generate(cls, *, kid: str, level: Literal[2, 3, 5] = 3) -> "MockDilithiumSigner":
         obj = cls(kid=kid, level=level)
         obj._sk = ed25519.Ed25519PrivateKey.generate()
+
+        # Both paddings depend only on the key/level, so build them once here.
+        sizes = _DILITHIUM_SIZES[int(level)]
+        pk_raw = obj._sk.public_key().public_bytes(
+            encoding=serialization.Encoding.Raw,
+            format=serialization.PublicFormat.Raw,
+        )
+        obj._padded_pk = pk_raw + _expand(pk_raw, max(0, sizes["pk"] - len(pk_raw)))
+        # The signature bulk is only there for size; it does not need to be a hash.
+        obj._sig_pad = _SIG_PAD[int(level)]
         return obj
 
+    def __getstate__(self) -> dict:
+        # Ed25519 key objects don't pickle; ship the raw private key (process pools)
+        state = self.__dict__.copy()
+        if self._sk is not None:
+            state["_sk"] = self._sk.private_bytes(
+                encoding=serialization.Encoding.Raw,
+                format=serialization.PrivateFormat.Raw,
+                encryption_algorithm=serialization.NoEncryption(),
+            )
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        state = dict(state)
+        if state.get("_sk") is not None:
+            state["_sk"] = ed25519.Ed25519PrivateKey.from_private_bytes(state["_sk"])
+        self.__dict__.update(state)
+
     def public_key_bytes(self) -> bytes:
         if self._sk is None:
             raise RuntimeError("Signer not initialised; call generate().")
-        pk_raw = self._sk.public_key().public_bytes(
-            encoding=serialization.Encoding.Raw,
-            format=serialization.PublicFormat.Raw,
-        )
-        pk_target = _DILITHIUM_SIZES[int(self.level)]["pk"]
-        if pk_target <= len(pk_raw):
-            return pk_raw
-        pad = _expand(pk_raw, pk_target - len(pk_raw))
-        return pk_raw + pad
+        return self._padded_pk
 
     def sign(self, msg: bytes) -> bytes:
         if self._sk is None:
             raise RuntimeError("Signer not initialised; call generate().")
-        _burn_cpu(b"sign" + msg[:32], _DILITHIUM_SIZES[int(self.level)]["sign_work"])
+        _burn_cpu(b"sign", msg, _DILITHIUM_SIZES[int(self.level)]["sign_work"])
         sig_raw = self._sk.sign(msg)  # 64 bytes
-        sig_target = _DILITHIUM_SIZES[int(self.level)]["sig"]
-        if sig_target <= len(sig_raw):
-            return sig_raw
-        pad = _expand(sig_raw, sig_target - len(sig_raw))
-        return sig_raw + pad
+        return sig_raw + self._sig_pad
 
     @staticmethod
     def verify(msg: bytes, sig: bytes, public_key: bytes) -> bool:
         try:
             # Infer "level" from public key length (best-effort).
-            level = {1312: 2, 1952: 3, 2592: 5}.get(len(public_key), 3)
-            _burn_cpu(b"verify" + msg[:32], _DILITHIUM_SIZES[level]["verify_work"])
+            level = _LEVEL_BY_PK_LEN.get(len(public_key), 3)
+            _burn_cpu(b"verify", msg, _DILITHIUM_SIZES[level]["verify_work"])
+
+            if sig[64:] != _SIG_PAD[level]:
+                return False
 
             pk_raw = public_key[:32]  # Ed25519 pk (in this mock)
-            pub = ed25519.Ed25519PublicKey.from_public_bytes(pk_raw)
+            pub = _load_ed25519_public_key(pk_raw)
             pub.verify(sig[:64], msg)  # first 64 bytes are Ed25519 signature
             return True
         except Exception:
@@ -1,11 +1,75 @@
 from __future__ import annotations
 
+import threading
 from dataclasses import dataclass
-from typing import Optional
+from functools import lru_cache
+from typing import Dict, Optional
 
 from .base import Signer
 
 
+# Round-3 Dilithium names and their FIPS 204 (ML-DSA) counterparts. These are different,
+# non-interoperable algorithms (sizes, domain separation); the map is only used to point
+# users at what their liboqs build does enable.
+_OQS_COUNTERPARTS: Dict[str, str] = {
+    "Dilithium2": "ML-DSA-44",
+    "Dilithium3": "ML-DSA-65",
+    "Dilithium5": "ML-DSA-87",
+}
+_OQS_COUNTERPARTS.update({v: k for k, v in list(_OQS_COUNTERPARTS.items())})
+
+
+@lru_cache(maxsize=None)
+def check_oqs_alg(oqs_alg: str) -> None:
+    """Raise ValueError if the installed liboqs does not enable `oqs_alg`.
+
+    liboqs already picks its AVX2 code paths at runtime (CPU feature detection inside
+    the library), so there are no separate "_AVX2" mechanisms to select. No-op if `oqs`
+    is not importable or cannot list its mechanisms.
+    """
+    try:
+        import oqs  # type: ignore
+    except Exception:
+        return
+
+    get_enabled = getattr(oqs, "get_enabled_sig_mechanisms", None)
+    if get_enabled is None:
+        return
+    enabled = list(get_enabled())
+    if oqs_alg in enabled:
+        return
+
+    hint = ""
+    counterpart = _OQS_COUNTERPARTS.get(oqs_alg)
+    if counterpart in enabled:
+        hint = f" {counterpart!r} is enabled, but it is a different algorithm; pass it explicitly to use it."
+    family = [m for m in enabled if m.startswith(("Dilithium", "ML-DSA"))]
+    raise ValueError(
+        f"OQS algorithm {oqs_alg!r} is not enabled in this liboqs build.{hint} "
+        f"Enabled Dilithium/ML-DSA mechanisms: {', '.join(family) or 'none'}."
+    )
+
+
+# One verifier object per algorithm. `verify()` takes the public key as an argument
+# and does not touch per-object key state, so a shared instance can serve all threads;
+# the lock only guards creation.
+_VERIFIER_CACHE: Dict[str, object] = {}
+_VERIFIER_LOCK = threading.Lock()
+
+
+def _get_verifier(oqs_alg: str) -> object:
+    verifier = _VERIFIER_CACHE.get(oqs_alg)
+    if verifier is None:
+        import oqs  # type: ignore
+
+        with _VERIFIER_LOCK:
+            verifier = _VERIFIER_CACHE.get(oqs_alg)
+            if verifier is None:
+                verifier = oqs.Signature(oqs_alg)  # type: ignore[attr-defined]
+                _VERIFIER_CACHE[oqs_alg] = verifier
+    return verifier
+
+
 @dataclass
 class OQSDilithiumSigner(Signer):
     """PQC signer backed by liboqs-python (if installed).
@@ -38,6 +102,7 @@ class OQSDilithiumSigner(Signer):
                 "and make sure liboqs is available on your system."
             ) from e
 
+        check_oqs_alg(oqs_alg)
         obj = cls(kid=kid, oqs_alg=oqs_alg)
 
         sig_obj = oqs.Signature(oqs_alg)  # type: ignore[attr-defined]
@@ -95,7 +160,7 @@ def oqs_verify(oqs_alg: str, msg: bytes, sig: bytes, public_key: bytes) -> bool:
         return False
 
     try:
-        verifier = oqs.Signature(oqs_alg)  # type: ignore[attr-defined]
+        verifier = _get_verifier(oqs_alg)
         ok = verifier.verify(msg, sig, public_key)  # type: ignore[attr-defined]
         return bool(ok)
     except Exception:
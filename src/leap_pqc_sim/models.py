@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+import binascii
 from datetime import datetime, timezone
-from typing import List
+from typing import Any, List, Optional
 
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, computed_field, model_validator
 
 
 class BusinessApplicationHeader(BaseModel):
@@ -47,13 +48,37 @@ class LiquidityTransfer(BaseModel):
 
 
 class SignatureEnvelope(BaseModel):
-    """A signature container so we can support RSA / PQC / hybrid."""
+    """A signature container so we can support RSA / PQC / hybrid.
+
+    The signature is held as raw bytes while the message is in memory; `sig_b64` is only
+    produced when the envelope is serialized (eg for size measurement or logging).
+    """
 
     model_config = ConfigDict(extra="forbid")
 
     alg: str = Field(..., description="Algorithm identifier.")
     kid: str = Field(..., description="Key identifier, used to fetch verification key.")
-    sig_b64: str = Field(..., description="Signature bytes, base64-encoded.")
+    sig: bytes = Field(..., exclude=True, description="Signature bytes.")
+    proof: Optional[List[str]] = Field(
+        None,
+        description="Merkle inclusion proof (base64 sibling hashes) when the signature covers a batch root.",
+    )
+    leaf_index: Optional[int] = Field(None, ge=0, description="Position of this message's leaf in the batch.")
+    leaf_count: Optional[int] = Field(None, ge=1, description="Number of leaves (messages) in the batch.")
+
+    @model_validator(mode="before")
+    @classmethod
+    def _decode_sig_b64(cls, data: Any) -> Any:
+        # Accept the serialized (base64) form so dumped envelopes validate back.
+        if isinstance(data, dict) and "sig_b64" in data and "sig" not in data:
+            data = dict(data)
+            data["sig"] = binascii.a2b_base64(data.pop("sig_b64"))
+        return data
+
+    @computed_field(description="Signature bytes, base64-encoded.")  # type: ignore[prop-decorator]
+    @property
+    def sig_b64(self) -> str:
+        return binascii.b2a_base64(self.sig, newline=False).decode("ascii")
 
 
 class PaymentMessage(BaseModel):
@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any, Mapping
+
+
+def write_json(path: Path, obj: Mapping[str, Any]) -> None:
+    """Write a result dict as indented UTF-8 JSON; ndarrays are written as lists.
+
+    Always stdlib `json`, even with orjson installed: orjson formats some floats
+    differently (`1e16` vs `1e+16`, `0.00001` vs `1e-05`) and writes NaN/inf as null,
+    so result files would depend on an optional extra. A result is written once per
+    run, so there is no speed to gain here.
+    """
+    text = json.dumps(obj, indent=2, ensure_ascii=False, default=lambda o: o.tolist())
+    path.write_text(text, encoding="utf-8")
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import hashlib
+import ssl
+from functools import lru_cache
+from typing import Dict, FrozenSet
+
+
+@lru_cache(maxsize=1)
+def cpu_flags() -> FrozenSet[str]:
+    """CPU feature flags from /proc/cpuinfo (empty if unavailable, eg non-Linux)."""
+    try:
+        with open("/proc/cpuinfo", encoding="ascii", errors="replace") as f:
+            for line in f:
+                if line.startswith("flags"):
+                    return frozenset(line.split(":", 1)[1].split())
+    except OSError:
+        pass
+    return frozenset()
+
+
+def crypto_backend_info() -> Dict[str, object]:
+    """Describe the hashing backend, so results from different machines can be compared.
+
+    `hashlib` (SHA-256 for Merkle leaves, RSA-PSS via `cryptography`) runs on OpenSSL,
+    which already dispatches to SHA-NI at runtime when the CPU has it; there is no
+    faster drop-in to select here. The mock PQC burn uses SHAKE256 (Keccak), which
+    SHA-NI does not accelerate. AVX2/BMI2 are what liboqs' optimized Dilithium and
+    Keccak code paths need; liboqs checks for them itself at runtime.
+    """
+    flags = cpu_flags()
+    return {
+        "openssl": ssl.OPENSSL_VERSION,
+        "hashlib_openssl": type(hashlib.sha256()).__module__ == "_hashlib",
+        "sha_ni": ("sha_ni" in flags) if flags else None,
+        "avx2": ("avx2" in flags) if flags else None,
+        "bmi2": ("bmi2" in flags) if flags else None,
+    }
@@ -1,39 +1,64 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Iterable, Dict, Any, List
+from typing import Iterable, Dict, Any, List, Union
 
 import numpy as np
 
+ArrayLike = Union[np.ndarray, Iterable[float]]
 
-def _to_np(xs: Iterable[float]) -> np.ndarray:
-    arr = np.array(list(xs), dtype=float)
-    if arr.size == 0:
-        return np.array([float("nan")], dtype=float)
-    return arr
+_NAN = float("nan")
+_EMPTY_MS: Dict[str, Any] = {
+    "count": 0,
+    "mean_ms": _NAN,
+    "p50_ms": _NAN,
+    "p90_ms": _NAN,
+    "p95_ms": _NAN,
+    "p99_ms": _NAN,
+    "max_ms": _NAN,
+}
+_EMPTY_BYTES: Dict[str, Any] = {
+    "count": 0,
+    "mean_bytes": _NAN,
+    "p50_bytes": _NAN,
+    "p95_bytes": _NAN,
+    "max_bytes": _NAN,
+}
 
 
-def summary_stats_ms(values_ms: Iterable[float]) -> Dict[str, Any]:
+def _to_np(xs: ArrayLike) -> np.ndarray:
+    # Arrays (what run_benchmark passes) are used as-is, any numeric dtype.
+    if isinstance(xs, np.ndarray):
+        return xs
+    return np.fromiter(xs, dtype=np.float64)  # no intermediate list copy
+
+
+def summary_stats_ms(values_ms: ArrayLike) -> Dict[str, Any]:
     a = _to_np(values_ms)
+    if a.size == 0:
+        return dict(_EMPTY_MS)
+    # one call -> one partition for all quantiles
+    p50, p90, p95, p99 = np.percentile(a, [50, 90, 95, 99]).tolist()
     return {
         "count": int(a.size),
-        "mean_ms": float(np.mean(a)),
-        "p50_ms": float(np.percentile(a, 50)),
-        "p90_ms": float(np.percentile(a, 90)),
-        "p95_ms": float(np.percentile(a, 95)),
-        "p99_ms": float(np.percentile(a, 99)),
-        "max_ms": float(np.max(a)),
+        "mean_ms": float(a.mean()),
+        "p50_ms": p50,
+        "p90_ms": p90,
+        "p95_ms": p95,
+        "p99_ms": p99,
+        "max_ms": float(a.max()),
     }
 
 
-def summary_stats_bytes(values: Iterable[int]) -> Dict[str, Any]:
-    a = np.array(list(values), dtype=float)
+def summary_stats_bytes(values: ArrayLike) -> Dict[str, Any]:
+    a = _to_np(values)
     if a.size == 0:
-        a = np.array([float("nan")], dtype=float)
+        return dict(_EMPTY_BYTES)
+    p50, p95 = np.percentile(a, [50, 95]).tolist()
     return {
         "count": int(a.size),
-        "mean_bytes": float(np.mean(a)),
-        "p50_bytes": float(np.percentile(a, 50)),
-        "p95_bytes": float(np.percentile(a, 95)),
-        "max_bytes": float(np.max(a)),
+        "mean_bytes": float(a.mean()),
+        "p50_bytes": p50,
+        "p95_bytes": p95,
+        "max_bytes": float(a.max()),
     }
@@ -0,0 +1,36 @@
+import pytest
+
+from leap_pqc_sim.canonical import canonical_json_bytes
+from leap_pqc_sim.models import BusinessApplicationHeader
+from leap_pqc_sim.sim.pipeline import _bah_bytes_for_signing, _bah_template
+
+
+def _bah(**kw):
+    fields = dict(
+        msg_id="6f96a0c2-2b1e-4b8a-9d3f-0123456789ff",
+        from_party="BICDEFFXXX",
+        to_party="BICITRRXXX",
+        msg_def_id="head.001",
+        creation_dt="2026-01-01T05:00:00+00:00",
+    )
+    fields.update(kw)
+    return BusinessApplicationHeader(**fields)
+
+
+def test_json_template_matches_canonical_json():
+    bah = _bah(from_party='BIC "quoted" \\ ünï', msg_id="id\nwith-newline")
+    assert _bah_bytes_for_signing(bah) == canonical_json_bytes(bah)
+
+
+@pytest.mark.parametrize("field", ["from_party", "to_party", "msg_def_id"])
+@pytest.mark.parametrize("text", ["__msg_id__", "__creation_dt__", "x__msg_id__y__creation_dt__"])
+def test_json_template_handles_slot_text_in_static_fields(field, text):
+    bah = _bah(**{field: text})
+    assert _bah_bytes_for_signing(bah) == canonical_json_bytes(bah)
+
+
+@pytest.mark.parametrize("field", ["from_party", "to_party", "msg_def_id"])
+@pytest.mark.parametrize("text", ["__msg_id__", "__creation_dt__"])
+def test_json_template_is_none_when_a_slot_does_not_split_once(field, text):
+    bah = _bah(**{field: text})
+    assert _bah_template(bah.from_party, bah.to_party, bah.msg_def_id) is None
@@ -0,0 +1,50 @@
+import pytest
+
+from leap_pqc_sim.sim.cache import LRUCache
+
+
+def test_get_missing_returns_none():
+    assert LRUCache[int](2).get("x") is None
+
+
+def test_evicts_least_recently_used():
+    cache = LRUCache[int](2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.put("c", 3)  # evicts "a"
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+    assert cache.get("c") == 3
+    assert len(cache) == 2
+
+
+def test_get_refreshes_recency():
+    cache = LRUCache[int](2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1  # "b" is now least recently used
+    cache.put("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+
+
+def test_put_existing_key_updates_and_refreshes():
+    cache = LRUCache[int](2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.put("a", 10)
+    cache.put("c", 3)  # evicts "b"
+    assert cache.get("a") == 10
+    assert cache.get("b") is None
+
+
+def test_false_values_are_cached():
+    # the gateway caches failed verifications as False
+    cache = LRUCache[bool](1)
+    cache.put("k", False)
+    assert cache.get("k") is False
+
+
+def test_maxsize_must_be_positive():
+    with pytest.raises(ValueError):
+        LRUCache(0)
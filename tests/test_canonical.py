@@ -0,0 +1,45 @@
+import pytest
+
+from leap_pqc_sim import canonical
+from leap_pqc_sim.models import PaymentMessage, SignatureEnvelope
+from leap_pqc_sim.sim.pipeline import _build_transfers
+
+
+def _both_paths(monkeypatch, objs):
+    fast = [canonical.canonical_json_bytes(o) for o in objs]
+    monkeypatch.setattr(canonical, "orjson", None)
+    return fast, [canonical.canonical_json_bytes(o) for o in objs]
+
+
+def test_orjson_and_stdlib_paths_agree(monkeypatch):
+    # canonical JSON is both signed and measured, so the optional fast path must not
+    # change a single byte for the messages the simulator builds
+    pytest.importorskip("orjson")
+    messages = [
+        PaymentMessage(
+            bah=bah,
+            document=doc,
+            signatures=[
+                SignatureEnvelope(alg="A", kid="k", sig=b"\x00\xff" * 8, proof=["AA=="], leaf_index=0, leaf_count=1)
+            ],
+        )
+        for bah, doc in _build_transfers(5)
+    ]
+    fast, stdlib = _both_paths(monkeypatch, messages)
+    assert fast == stdlib
+
+
+@pytest.mark.parametrize("amount", [1e16, 1e-5, 1e-7, 1.5e300, 9.999999999999999e-05, 0.0001, 123.45])
+def test_orjson_and_stdlib_agree_for_any_amount(monkeypatch, amount):
+    pytest.importorskip("orjson")
+    (bah, doc), = _build_transfers(1)
+    doc = doc.model_copy(update={"amount": amount})
+    fast, stdlib = _both_paths(monkeypatch, [doc, {"xs": [amount, -amount]}])
+    assert fast == stdlib
+
+
+@pytest.mark.parametrize("value", [float("nan"), float("inf"), -float("inf"), 2**70, {2.5e-9: 1}])
+def test_orjson_and_stdlib_agree_outside_orjson_range(monkeypatch, value):
+    pytest.importorskip("orjson")
+    fast, stdlib = _both_paths(monkeypatch, [{"v": value}, [value]])
+    assert fast == stdlib
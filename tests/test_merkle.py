@@ -0,0 +1,62 @@
+import pytest
+
+from leap_pqc_sim.crypto import merkle_leaf, merkle_root_and_proofs, merkle_root_from_proof
+
+
+def _leaves(n):
+    return [merkle_leaf(f"bah-{i}".encode()) for i in range(n)]
+
+
+@pytest.mark.parametrize("n", [1, 2, 3, 7])
+def test_proof_round_trips_for_every_leaf(n):
+    leaves = _leaves(n)
+    root, proofs = merkle_root_and_proofs(leaves)
+    assert len(proofs) == n
+    for i, proof in enumerate(proofs):
+        assert merkle_root_from_proof(leaves[i], i, n, proof) == root
+
+
+def test_single_leaf_root_is_the_leaf():
+    leaves = _leaves(1)
+    root, proofs = merkle_root_and_proofs(leaves)
+    assert root == leaves[0]
+    assert proofs == [[]]
+
+
+@pytest.mark.parametrize("n", [2, 3, 7])
+def test_wrong_index_fails(n):
+    leaves = _leaves(n)
+    root, proofs = merkle_root_and_proofs(leaves)
+    for i, proof in enumerate(proofs):
+        assert merkle_root_from_proof(leaves[i], (i + 1) % n, n, proof) != root
+
+
+@pytest.mark.parametrize("n", [2, 3, 7])
+def test_wrong_proof_fails(n):
+    leaves = _leaves(n)
+    root, proofs = merkle_root_and_proofs(leaves)
+    for i, proof in enumerate(proofs):
+        tampered = [bytes([proof[0][0] ^ 0x01]) + proof[0][1:]] + proof[1:]
+        assert merkle_root_from_proof(leaves[i], i, n, tampered) != root
+        # another leaf's proof does not prove this leaf
+        other = proofs[(i + 1) % n]
+        assert merkle_root_from_proof(leaves[i], i, n, other) != root
+
+
+def test_malformed_proof_returns_none():
+    leaves = _leaves(7)
+    _, proofs = merkle_root_and_proofs(leaves)
+    assert merkle_root_from_proof(leaves[0], 0, 7, proofs[0][:-1]) is None  # too short
+    assert merkle_root_from_proof(leaves[0], 0, 7, proofs[0] + [leaves[1]]) is None  # too long
+    assert merkle_root_from_proof(leaves[0], 7, 7, proofs[0]) is None  # index out of range
+
+
+def test_odd_node_is_not_duplicated():
+    # CVE-2012-2459: duplicating the odd last node makes [a, b, c] and [a, b, c, c] collide
+    a, b, c = _leaves(3)
+    assert merkle_root_and_proofs([a, b, c])[0] != merkle_root_and_proofs([a, b, c, c])[0]
+
+
+def test_empty_tree_rejected():
+    with pytest.raises(ValueError):
+        merkle_root_and_proofs([])
@@ -0,0 +1,37 @@
+import pytest
+
+from leap_pqc_sim.sim import SimulationConfig, run_benchmark
+
+N = 8
+
+
+@pytest.mark.parametrize("fault", [None, "invalid_sig", "unknown_kid"])
+@pytest.mark.parametrize("executor", ["thread", "process"])
+@pytest.mark.parametrize("batch_size", [1, 4])
+@pytest.mark.parametrize("mode", ["rsa", "pqc", "hybrid"])
+def test_run_benchmark_end_to_end(mode, batch_size, executor, fault):
+    out = run_benchmark(
+        SimulationConfig(
+            mode=mode, n=N, concurrency=2, mock_level=2, batch_size=batch_size, executor=executor, fault=fault
+        )
+    )
+    summary, meta = out["summary"], out["meta"]
+
+    assert (summary["accepted"], summary["rejected"]) == ((N, 0) if fault is None else (0, N))
+    assert summary["message_size"]["count"] == N
+    assert len(out["raw"]["verify_times_ms"]) == N
+
+    assert "verify_cache_hit_rate" in meta
+    if batch_size == 1:
+        # auto cache size: off without batching
+        assert meta["verify_cache_size"] == 0
+        assert meta["verify_cache_hit_rate"] is None
+    elif fault is None:
+        # one miss per batch (its first message), then hits on the shared root signature
+        assert meta["verify_cache_hit_rate"] == pytest.approx((batch_size - 1) / batch_size)
+
+
+def test_run_benchmark_without_raw():
+    out = run_benchmark(SimulationConfig(mode="rsa", n=2, concurrency=1, include_raw=False))
+    assert "raw" not in out
+    assert out["summary"]["accepted"] == 2
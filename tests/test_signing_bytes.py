@@ -0,0 +1,49 @@
+import pytest
+
+from leap_pqc_sim.canonical import canonical_json_bytes
+from leap_pqc_sim.models import BusinessApplicationHeader
+from leap_pqc_sim.sim.pipeline import _SIGNING_BYTES, _bah_bytes_for_signing_packed
+
+UUID = "6f96a0c2-2b1e-4b8a-9d3f-0123456789ff"
+
+
+def _bah(**kw):
+    fields = dict(
+        msg_id=UUID,
+        from_party="BICDEFFXXX",
+        to_party="BICITRRXXX",
+        msg_def_id="head.001",
+        creation_dt="2026-01-01T05:00:00+00:00",
+    )
+    fields.update(kw)
+    return BusinessApplicationHeader(**fields)
+
+
+@pytest.mark.parametrize(
+    "a, b",
+    [
+        ({"msg_id": UUID}, {"msg_id": "{" + UUID.upper() + "}"}),
+        ({"creation_dt": "2026-01-01T05:00:00+00:00"}, {"creation_dt": "2026-01-01T07:00:00+02:00"}),
+        ({"creation_dt": "2026-01-01T05:00:00"}, {"creation_dt": "2026-01-01T05:00:00+00:00"}),
+        ({"msg_id": "ab", "creation_dt": "c"}, {"msg_id": "a", "creation_dt": "bc"}),
+        ({"from_party": "A"}, {"from_party": "B"}),
+    ],
+)
+@pytest.mark.parametrize("mode", sorted(_SIGNING_BYTES))
+def test_distinct_headers_sign_differently(mode, a, b):
+    encode = _SIGNING_BYTES[mode]
+    assert encode(_bah(**a)) != encode(_bah(**b))
+
+
+def test_packed_accepts_non_uuid_msg_id():
+    assert _bah_bytes_for_signing_packed(_bah(msg_id="not-a-uuid"))
+
+
+def test_packed_is_deterministic():
+    assert _bah_bytes_for_signing_packed(_bah()) == _bah_bytes_for_signing_packed(_bah())
+
+
+def test_packed_is_domain_separated_from_json():
+    packed = _bah_bytes_for_signing_packed(_bah())
+    assert not packed.startswith(b"{")
+    assert canonical_json_bytes(_bah()).startswith(b"{")